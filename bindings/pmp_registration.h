@@ -13,6 +13,7 @@
 
 // PMP headers - Core
 #include <pmp/bounding_box.h>
+#include <pmp/exceptions.h>
 #include <pmp/surface_mesh.h>
 #include <pmp/types.h>
 
@@ -35,10 +36,63 @@
 
 // PMP headers - IO
 #include <pmp/io/io.h>
+#include <pmp/io/read_obj.h>
+#include <pmp/io/read_off.h>
+#include <pmp/io/read_pmp.h>
+#include <pmp/io/read_stl.h>
+
+#include <algorithm>
+#include <array>
+#include <charconv>
+#include <cmath>
+#include <cstdint>
+#include <cstdio>
+#include <cstring>
+#include <fstream>
+#include <unordered_map>
+#include <vector>
+
+#if defined(__unix__) || defined(__APPLE__)
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#define PMP_ROSETTA_HAS_MMAP 1
+#endif
+
+// Floating-point std::to_chars needs libstdc++ >= 11, or Apple libc++ with a
+// macOS 13.3 deployment target; other toolchains format with snprintf
+#if (defined(__cpp_lib_to_chars) && __cpp_lib_to_chars >= 201611L) || \
+    (defined(__ENVIRONMENT_MAC_OS_X_VERSION_MIN_REQUIRED__) &&        \
+     __ENVIRONMENT_MAC_OS_X_VERSION_MIN_REQUIRED__ >= 130300)
+#define PMP_ROSETTA_HAS_FLOAT_TO_CHARS 1
+#endif
 
 // NOTE: Do NOT use "using namespace pmp;" here - we need fully qualified names
 // for the overload macros to generate correct code.
 
+// Release the GIL for the duration of a long C++ call, so Python threads (batch
+// pipeline, GUI) keep running. The header includes pybind11 itself whenever it
+// and Python.h are on the include path (the Python module build), so the
+// include order of the generated module does not matter; it is a no-op for the
+// generator and the other targets. Building the module with
+// -DPMP_ROSETTA_PYTHON turns a missing pybind11 into a build error instead of
+// silently keeping the GIL.
+#if __has_include(<pybind11/pybind11.h>) && __has_include(<Python.h>)
+#define PMP_ROSETTA_HAS_PYBIND11 1
+#endif
+
+#if defined(PMP_ROSETTA_PYTHON) && !defined(PMP_ROSETTA_HAS_PYBIND11)
+#error "PMP_ROSETTA_PYTHON is defined but pybind11 or Python.h is not on the include path"
+#endif
+
+#ifdef PMP_ROSETTA_HAS_PYBIND11
+#include <pybind11/pybind11.h>
+#define PMP_ROSETTA_RELEASE_GIL pybind11::gil_scoped_release release_gil_
+#else
+#define PMP_ROSETTA_RELEASE_GIL
+#endif
+
 // Copy a mesh in C++
 inline pmp::SurfaceMesh copy_mesh(const pmp::SurfaceMesh &src) {
     return pmp::SurfaceMesh(src);
@@ -49,6 +103,454 @@ inline void load_mesh(pmp::SurfaceMesh &mesh, const std::filesystem::path &filep
     pmp::read(mesh, filepath);
 }
 
+// Append vertices from a flat [x0, y0, z0, x1, ...] buffer in one call
+inline void add_vertices(pmp::SurfaceMesh &mesh, const std::vector<pmp::Scalar> &coords) {
+    if (coords.size() % 3 != 0)
+        throw pmp::InvalidInputException("add_vertices: size is not a multiple of 3.");
+    const std::size_t n = coords.size() / 3;
+    mesh.reserve(mesh.n_vertices() + n, mesh.n_edges(), mesh.n_faces());
+    for (std::size_t i = 0; i < n; ++i)
+        mesh.add_vertex(pmp::Point(coords[3 * i], coords[3 * i + 1], coords[3 * i + 2]));
+}
+
+// Append triangles from a flat [a0, b0, c0, a1, ...] buffer of vertex indices
+inline void add_triangles(pmp::SurfaceMesh &mesh, const std::vector<pmp::IndexType> &indices) {
+    if (indices.size() % 3 != 0)
+        throw pmp::InvalidInputException("add_triangles: size is not a multiple of 3.");
+    const std::size_t n          = indices.size() / 3;
+    const auto        n_vertices = static_cast<pmp::IndexType>(mesh.vertices_size());
+    for (auto i : indices) {
+        if (i >= n_vertices)
+            throw pmp::InvalidInputException("add_triangles: vertex index out of range.");
+    }
+    mesh.reserve(mesh.n_vertices(), mesh.n_edges() + 3 * n / 2, mesh.n_faces() + n);
+    for (std::size_t i = 0; i < n; ++i)
+        mesh.add_triangle(pmp::Vertex(indices[3 * i]), pmp::Vertex(indices[3 * i + 1]),
+                          pmp::Vertex(indices[3 * i + 2]));
+}
+
+// Build a triangle mesh from flat coordinate and index buffers in one call
+inline pmp::SurfaceMesh build_triangle_mesh(const std::vector<pmp::Scalar>    &coords,
+                                            const std::vector<pmp::IndexType> &indices) {
+    PMP_ROSETTA_RELEASE_GIL;
+    pmp::SurfaceMesh  mesh;
+    const std::size_t n_vertices = coords.size() / 3;
+    mesh.reserve(n_vertices, 3 * n_vertices, indices.size() / 3);
+    add_vertices(mesh, coords);
+    add_triangles(mesh, indices);
+    return mesh;
+}
+
+// Reorder triangles for the GPU post-transform vertex cache (Tipsify, Sander
+// et al. 2007): fan around a vertex, then continue from the recent vertex that
+// is most likely still cached. Returns the new order as triangle indices.
+inline std::vector<pmp::IndexType>
+optimize_triangle_order(const std::vector<pmp::IndexType> &indices, pmp::IndexType n_vertices,
+                        unsigned int cache_size) {
+    PMP_ROSETTA_RELEASE_GIL;
+    if (indices.size() % 3 != 0)
+        throw pmp::InvalidInputException("optimize_triangle_order: size is not a multiple of 3.");
+    const std::size_t n_triangles = indices.size() / 3;
+
+    // Vertex -> incident triangles, in compressed rows
+    std::vector<std::size_t> offset(n_vertices + 1, 0);
+    for (auto v : indices) {
+        if (v >= n_vertices)
+            throw pmp::InvalidInputException("optimize_triangle_order: vertex index out of range.");
+        ++offset[v + 1];
+    }
+    for (pmp::IndexType v = 0; v < n_vertices; ++v)
+        offset[v + 1] += offset[v];
+    std::vector<pmp::IndexType> adjacency(indices.size());
+    std::vector<std::size_t>    fill(offset.begin(), offset.end() - 1);
+    for (std::size_t t = 0; t < n_triangles; ++t) {
+        for (int k = 0; k < 3; ++k)
+            adjacency[fill[indices[3 * t + k]]++] = static_cast<pmp::IndexType>(t);
+    }
+
+    std::vector<std::size_t> live(n_vertices); // triangles not emitted yet
+    for (pmp::IndexType v = 0; v < n_vertices; ++v)
+        live[v] = offset[v + 1] - offset[v];
+    std::vector<std::size_t>    timestamp(n_vertices, 0);
+    std::vector<bool>           emitted(n_triangles, false);
+    std::vector<pmp::IndexType> dead_end, candidates, order;
+    order.reserve(n_triangles);
+
+    std::size_t    time    = cache_size + 1;
+    pmp::IndexType cursor  = 0;
+    long long      fanning = n_triangles > 0 ? 0 : -1;
+    while (fanning >= 0) {
+        const auto f = static_cast<pmp::IndexType>(fanning);
+        candidates.clear();
+        for (std::size_t i = offset[f]; i < offset[f + 1]; ++i) {
+            const pmp::IndexType t = adjacency[i];
+            if (emitted[t])
+                continue;
+            for (int k = 0; k < 3; ++k) {
+                const pmp::IndexType v = indices[3 * t + k];
+                dead_end.push_back(v);
+                candidates.push_back(v);
+                --live[v];
+                if (time - timestamp[v] > cache_size)
+                    timestamp[v] = time++;
+            }
+            emitted[t] = true;
+            order.push_back(t);
+        }
+
+        // Next fanning vertex: the candidate that stays longest in the cache,
+        // else the most recent vertex with triangles left, else a scan
+        long long next = -1, best = -1;
+        for (auto v : candidates) {
+            if (live[v] == 0)
+                continue;
+            long long priority = 0;
+            if (time - timestamp[v] + 2 * live[v] <= cache_size)
+                priority = static_cast<long long>(time - timestamp[v]);
+            if (priority > best) {
+                best = priority;
+                next = v;
+            }
+        }
+        while (next < 0 && !dead_end.empty()) {
+            const pmp::IndexType d = dead_end.back();
+            dead_end.pop_back();
+            if (live[d] > 0)
+                next = d;
+        }
+        while (next < 0 && cursor < n_vertices) {
+            if (live[cursor] > 0)
+                next = cursor;
+            else
+                ++cursor;
+        }
+        fanning = next;
+    }
+    return order;
+}
+
+// GIL-releasing wrappers, registered under the original PMP names
+inline void uniform_remeshing_nogil(pmp::SurfaceMesh &mesh, pmp::Scalar edge_length,
+                                    unsigned int iterations, bool use_projection) {
+    PMP_ROSETTA_RELEASE_GIL;
+    pmp::uniform_remeshing(mesh, edge_length, iterations, use_projection);
+}
+
+inline void adaptive_remeshing_nogil(pmp::SurfaceMesh &mesh, pmp::Scalar min_edge_length,
+                                     pmp::Scalar max_edge_length, pmp::Scalar approx_error,
+                                     unsigned int iterations, bool use_projection) {
+    PMP_ROSETTA_RELEASE_GIL;
+    pmp::adaptive_remeshing(mesh, min_edge_length, max_edge_length, approx_error, iterations,
+                            use_projection);
+}
+
+inline void triangulate_nogil(pmp::SurfaceMesh &mesh) {
+    PMP_ROSETTA_RELEASE_GIL;
+    pmp::triangulate(mesh);
+}
+
+inline pmp::BoundingBox bounds_nogil(const pmp::SurfaceMesh &mesh) {
+    PMP_ROSETTA_RELEASE_GIL;
+    return pmp::bounds(mesh);
+}
+
+inline void read_nogil(pmp::SurfaceMesh &mesh, const std::filesystem::path &filepath) {
+    PMP_ROSETTA_RELEASE_GIL;
+    pmp::read(mesh, filepath);
+}
+
+inline void read_obj_nogil(pmp::SurfaceMesh &mesh, const std::filesystem::path &filepath) {
+    PMP_ROSETTA_RELEASE_GIL;
+    pmp::read_obj(mesh, filepath);
+}
+
+inline void read_off_nogil(pmp::SurfaceMesh &mesh, const std::filesystem::path &filepath) {
+    PMP_ROSETTA_RELEASE_GIL;
+    pmp::read_off(mesh, filepath);
+}
+
+inline void read_pmp_nogil(pmp::SurfaceMesh &mesh, const std::filesystem::path &filepath) {
+    PMP_ROSETTA_RELEASE_GIL;
+    pmp::read_pmp(mesh, filepath);
+}
+
+inline void read_stl_nogil(pmp::SurfaceMesh &mesh, const std::filesystem::path &filepath) {
+    PMP_ROSETTA_RELEASE_GIL;
+    pmp::read_stl(mesh, filepath);
+}
+
+inline void write_nogil(const pmp::SurfaceMesh &mesh, const std::filesystem::path &filepath,
+                        const pmp::IOFlags &flags) {
+    PMP_ROSETTA_RELEASE_GIL;
+    pmp::write(mesh, filepath, flags);
+}
+
+// Read a binary STL by mapping the file read-only and decoding the 50-byte
+// facet records in place. ASCII files (and platforms without mmap) fall back
+// to pmp::read_stl. Duplicate corners are merged like the PMP reader does.
+inline void read_stl_mmap(pmp::SurfaceMesh &mesh, const std::filesystem::path &filepath) {
+    PMP_ROSETTA_RELEASE_GIL;
+#ifdef PMP_ROSETTA_HAS_MMAP
+    const int fd = ::open(filepath.c_str(), O_RDONLY);
+    if (fd < 0)
+        throw pmp::IOException("Failed to open file: " + filepath.string());
+
+    struct stat st;
+    if (::fstat(fd, &st) != 0 || st.st_size < 84) {
+        ::close(fd);
+        pmp::read_stl(mesh, filepath);
+        return;
+    }
+    const auto file_size = static_cast<std::size_t>(st.st_size);
+
+    void *addr = ::mmap(nullptr, file_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    ::close(fd);
+    if (addr == MAP_FAILED)
+        throw pmp::IOException("Failed to map file: " + filepath.string());
+
+    // Unmapped on every exit, including exceptions from add_triangle on
+    // non-manifold input
+    struct Mapping {
+        void       *addr;
+        std::size_t size;
+        ~Mapping() { ::munmap(addr, size); }
+    };
+    const Mapping mapping{addr, file_size};
+    const auto   *data = static_cast<const char *>(addr);
+
+    std::uint32_t n_triangles;
+    std::memcpy(&n_triangles, data + 80, sizeof(n_triangles));
+
+    // Anything that is not exactly header + records is ASCII (or corrupt)
+    if (file_size != 84 + 50 * static_cast<std::size_t>(n_triangles)) {
+        pmp::read_stl(mesh, filepath);
+        return;
+    }
+    ::madvise(addr, file_size, MADV_SEQUENTIAL);
+
+    struct KeyHash {
+        std::size_t operator()(const std::array<std::uint32_t, 3> &k) const {
+            std::size_t h = k[0];
+            h             = h * 0x9E3779B97F4A7C15ull ^ k[1];
+            h             = h * 0x9E3779B97F4A7C15ull ^ k[2];
+            return h;
+        }
+    };
+    std::unordered_map<std::array<std::uint32_t, 3>, pmp::Vertex, KeyHash> vertex_map;
+    vertex_map.reserve(n_triangles / 2 + 3);
+    mesh.reserve(n_triangles / 2 + 3, 3 * n_triangles / 2, n_triangles);
+
+    const char *record = data + 84;
+    pmp::Vertex v[3];
+    for (std::uint32_t i = 0; i < n_triangles; ++i, record += 50) {
+        // Skip the facet normal (12 bytes), read the three corners
+        for (int j = 0; j < 3; ++j) {
+            float p[3];
+            std::memcpy(p, record + 12 + 12 * j, 12);
+            for (float &c : p) {
+                if (c == 0.0f)
+                    c = 0.0f; // merge -0 and +0
+            }
+            std::array<std::uint32_t, 3> key;
+            std::memcpy(key.data(), p, 12);
+            auto it = vertex_map.find(key);
+            if (it == vertex_map.end()) {
+                v[j] = mesh.add_vertex(pmp::Point(p[0], p[1], p[2]));
+                vertex_map.emplace(key, v[j]);
+            } else {
+                v[j] = it->second;
+            }
+        }
+
+        // Degenerate facets are dropped, as in pmp::read_stl
+        if (v[0] != v[1] && v[0] != v[2] && v[1] != v[2])
+            mesh.add_triangle(v[0], v[1], v[2]);
+    }
+#else
+    pmp::read_stl(mesh, filepath);
+#endif
+}
+
+// Write a binary STL through a large stream buffer (fewer write syscalls on
+// big meshes than the default-buffered pmp::write)
+inline void write_stl_buffered(const pmp::SurfaceMesh      &mesh,
+                               const std::filesystem::path &filepath) {
+    PMP_ROSETTA_RELEASE_GIL;
+    if (!mesh.is_triangle_mesh())
+        throw pmp::InvalidInputException("write_stl_buffered: Not a triangle mesh.");
+
+    std::vector<char> buffer(8 * 1024 * 1024);
+    std::ofstream     ofs;
+    ofs.rdbuf()->pubsetbuf(buffer.data(), buffer.size());
+    ofs.open(filepath, std::ios::binary);
+    if (!ofs)
+        throw pmp::IOException("Failed to open file: " + filepath.string());
+
+    char header[80] = "Binary STL written by pmp-rosetta";
+    ofs.write(header, 80);
+    auto n_faces = static_cast<std::uint32_t>(mesh.n_faces());
+    ofs.write(reinterpret_cast<const char *>(&n_faces), sizeof(n_faces));
+
+    // 50 bytes per facet: normal, three corners, 16-bit attribute count. The
+    // record is unaligned, so floats go in with memcpy (as read_stl_mmap reads)
+    char record[50] = {};
+
+    auto put_vector = [&](int slot, const pmp::Point &p) {
+        const float xyz[3] = {static_cast<float>(p[0]), static_cast<float>(p[1]),
+                              static_cast<float>(p[2])};
+        std::memcpy(record + 12 * slot, xyz, 12);
+    };
+    for (auto f : mesh.faces()) {
+        put_vector(0, pmp::face_normal(mesh, f));
+        int slot = 1;
+        for (auto v : mesh.vertices(f))
+            put_vector(slot++, mesh.position(v));
+        ofs.write(record, 50);
+    }
+    ofs.close();
+    if (!ofs)
+        throw pmp::IOException("Failed to write file: " + filepath.string());
+}
+
+// Bounding box over the raw, contiguous position array. Unlike pmp::bounds it
+// does not test each vertex for deletion, so the min/max loop vectorizes.
+// Meshes with deleted vertices go through pmp::bounds.
+inline pmp::BoundingBox bounds_fast(const pmp::SurfaceMesh &mesh) {
+    if (mesh.has_garbage() || mesh.n_vertices() == 0)
+        return pmp::bounds(mesh);
+
+    auto                           points    = mesh.get_vertex_property<pmp::Point>("v:point");
+    const std::vector<pmp::Point> &positions = points.vector();
+    pmp::Scalar                    lo[3]     = {positions[0][0], positions[0][1], positions[0][2]};
+    pmp::Scalar                    hi[3]     = {lo[0], lo[1], lo[2]};
+    for (const auto &p : positions) {
+        for (int k = 0; k < 3; ++k) {
+            lo[k] = std::min(lo[k], p[k]);
+            hi[k] = std::max(hi[k], p[k]);
+        }
+    }
+    return pmp::BoundingBox(pmp::Point(lo[0], lo[1], lo[2]), pmp::Point(hi[0], hi[1], hi[2]));
+}
+
+// Shortest round-trip formatting of a float. The snprintf fallback ("%.9g")
+// also round-trips, with longer output.
+inline char *format_float(char *out, char *end, float value) {
+#ifdef PMP_ROSETTA_HAS_FLOAT_TO_CHARS
+    return std::to_chars(out, end, value).ptr;
+#else
+    return out + std::snprintf(out, static_cast<std::size_t>(end - out), "%.9g", value);
+#endif
+}
+
+// Write an OBJ (positions and faces only) formatting numbers with
+// std::to_chars where available (shortest round-trip, no printf parsing) into
+// a memory buffer that is flushed to disk in large blocks.
+inline void write_obj_fast(const pmp::SurfaceMesh &mesh, const std::filesystem::path &filepath) {
+    PMP_ROSETTA_RELEASE_GIL;
+    std::ofstream ofs(filepath, std::ios::binary);
+    if (!ofs)
+        throw pmp::IOException("Failed to open file: " + filepath.string());
+
+    constexpr std::size_t block_size = 8 * 1024 * 1024;
+    constexpr std::size_t max_line   = 128; // "v" + 3 floats, or "f" + 3 indices
+    std::vector<char>     buffer(block_size + max_line);
+    char                 *out = buffer.data();
+    char *const           end = buffer.data() + buffer.size();
+
+    auto flush_if_full = [&]() {
+        if (out - buffer.data() >= static_cast<std::ptrdiff_t>(block_size)) {
+            ofs.write(buffer.data(), out - buffer.data());
+            out = buffer.data();
+        }
+    };
+
+    // OBJ indices are 1-based and must skip deleted vertices
+    std::vector<pmp::IndexType> index(mesh.vertices_size(), 0);
+    pmp::IndexType              next = 1;
+    for (auto v : mesh.vertices()) {
+        index[v.idx()]      = next++;
+        const pmp::Point &p = mesh.position(v);
+        *out++              = 'v';
+        for (int k = 0; k < 3; ++k) {
+            *out++ = ' ';
+            out    = format_float(out, end, static_cast<float>(p[k]));
+        }
+        *out++ = '\n';
+        flush_if_full();
+    }
+
+    for (auto f : mesh.faces()) {
+        *out++ = 'f';
+        for (auto v : mesh.vertices(f)) {
+            *out++ = ' ';
+            out    = std::to_chars(out, end, index[v.idx()]).ptr;
+            // Polygons can have more corners than fit the line budget
+            flush_if_full();
+        }
+        *out++ = '\n';
+        flush_if_full();
+    }
+
+    ofs.write(buffer.data(), out - buffer.data());
+    ofs.close();
+    if (!ofs)
+        throw pmp::IOException("Failed to write file: " + filepath.string());
+}
+
+// Write triangle corners quantized to 8 or 16 bits per coordinate relative
+// to the bounding box. Layout (little endian):
+//   "PMPQ" | uint32 bits | uint32 n_faces | float lo[3] | float hi[3]
+//   | n_faces * 9 unsigned ints of (bits/8) bytes each
+// int_coord = round((x - lo) * (2^bits - 1) / (hi - lo))
+// Files use the .pmpq extension (example.py --quantize=8|16).
+inline void write_quantized(const pmp::SurfaceMesh &mesh, const std::filesystem::path &filepath,
+                            unsigned int bits) {
+    PMP_ROSETTA_RELEASE_GIL;
+    if (!mesh.is_triangle_mesh())
+        throw pmp::InvalidInputException("write_quantized: Not a triangle mesh.");
+    if (bits != 8 && bits != 16)
+        throw pmp::InvalidInputException("write_quantized: bits must be 8 or 16.");
+
+    std::vector<char> buffer(8 * 1024 * 1024);
+    std::ofstream     ofs;
+    ofs.rdbuf()->pubsetbuf(buffer.data(), buffer.size());
+    ofs.open(filepath, std::ios::binary);
+    if (!ofs)
+        throw pmp::IOException("Failed to open file: " + filepath.string());
+
+    const pmp::BoundingBox bb = bounds_fast(mesh);
+    float                  lo[3], hi[3], scale[3];
+    const float            q_max = static_cast<float>((1u << bits) - 1);
+    for (int k = 0; k < 3; ++k) {
+        lo[k]    = static_cast<float>(bb.min()[k]);
+        hi[k]    = static_cast<float>(bb.max()[k]);
+        scale[k] = hi[k] > lo[k] ? q_max / (hi[k] - lo[k]) : 0.0f;
+    }
+
+    const std::uint32_t header[2] = {bits, static_cast<std::uint32_t>(mesh.n_faces())};
+    ofs.write("PMPQ", 4);
+    ofs.write(reinterpret_cast<const char *>(header), sizeof(header));
+    ofs.write(reinterpret_cast<const char *>(lo), sizeof(lo));
+    ofs.write(reinterpret_cast<const char *>(hi), sizeof(hi));
+
+    for (auto f : mesh.faces()) {
+        for (auto v : mesh.vertices(f)) {
+            const pmp::Point &p = mesh.position(v);
+            for (int k = 0; k < 3; ++k) {
+                const auto q = static_cast<std::uint16_t>(
+                    std::lround((static_cast<float>(p[k]) - lo[k]) * scale[k]));
+                if (bits == 16)
+                    ofs.write(reinterpret_cast<const char *>(&q), 2);
+                else
+                    ofs.put(static_cast<char>(q));
+            }
+        }
+    }
+    ofs.close();
+    if (!ofs)
+        throw pmp::IOException("Failed to write file: " + filepath.string());
+}
+
 namespace pmp_rosetta {
 
     inline void register_all() {
@@ -114,7 +616,12 @@ namespace pmp_rosetta {
             // Memory management
             .method("clear", &pmp::SurfaceMesh::clear)
             .method("reserve", &pmp::SurfaceMesh::reserve)
-            .method("garbage_collection", &pmp::SurfaceMesh::garbage_collection)
+            .method("has_garbage", &pmp::SurfaceMesh::has_garbage)
+            .lambda_method<void>("garbage_collection",
+                                 [](pmp::SurfaceMesh &self) {
+                                     PMP_ROSETTA_RELEASE_GIL;
+                                     self.garbage_collection();
+                                 })
             .lambda_method_const<std::vector<pmp::Scalar>>("vertices",
                                                            [](const pmp::SurfaceMesh &self) {
                                                                std::vector<pmp::Scalar> pos;
@@ -151,9 +658,14 @@ namespace pmp_rosetta {
         ROSETTA_REGISTER_FUNCTION(pmp::explicit_smoothing);
         ROSETTA_REGISTER_FUNCTION(pmp::implicit_smoothing);
 
-        // Remeshing
-        ROSETTA_REGISTER_FUNCTION(pmp::uniform_remeshing);
-        ROSETTA_REGISTER_FUNCTION(pmp::adaptive_remeshing);
+        // Remeshing (the *_nogil wrappers keep the PMP names but release the GIL)
+        ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(
+            uniform_remeshing_nogil, "uniform_remeshing",
+            void (*)(pmp::SurfaceMesh &, pmp::Scalar, unsigned int, bool));
+        ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(adaptive_remeshing_nogil, "adaptive_remeshing",
+                                                void (*)(pmp::SurfaceMesh &, pmp::Scalar,
+                                                         pmp::Scalar, pmp::Scalar, unsigned int,
+                                                         bool));
 
         // Subdivision
         ROSETTA_REGISTER_FUNCTION(pmp::loop_subdivision);
@@ -191,7 +703,9 @@ namespace pmp_rosetta {
         ROSETTA_REGISTER_FUNCTION(pmp::lscm_parameterization);
 
         // Utilities (non-overloaded)
-        ROSETTA_REGISTER_FUNCTION(pmp::bounds);
+        ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(bounds_nogil, "bounds",
+                                                pmp::BoundingBox (*)(const pmp::SurfaceMesh &));
+        ROSETTA_REGISTER_FUNCTION(bounds_fast);
         ROSETTA_REGISTER_FUNCTION(pmp::surface_area);
         ROSETTA_REGISTER_FUNCTION(pmp::volume);
         ROSETTA_REGISTER_FUNCTION(pmp::flip_faces);
@@ -204,7 +718,8 @@ namespace pmp_rosetta {
         // Triangulation has two overloads:
         //   void triangulate(SurfaceMesh& mesh)
         //   void triangulate(SurfaceMesh& mesh, Face f)
-        ROSETTA_REGISTER_OVERLOADED_FUNCTION(pmp::triangulate, void (*)(pmp::SurfaceMesh &));
+        ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(triangulate_nogil, "triangulate",
+                                                void (*)(pmp::SurfaceMesh &));
         ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(pmp::triangulate, "triangulate_face",
                                                 void (*)(pmp::SurfaceMesh &, pmp::Face));
 
@@ -217,8 +732,31 @@ namespace pmp_rosetta {
         // ========================================================================
 
         // void read(SurfaceMesh& mesh, const std::filesystem::path& file)
-        ROSETTA_REGISTER_OVERLOADED_FUNCTION(
-            pmp::read, void (*)(pmp::SurfaceMesh &, const std::filesystem::path &));
+        ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(
+            read_nogil, "read", void (*)(pmp::SurfaceMesh &, const std::filesystem::path &));
+
+        // Format-specific readers (skip the extension dispatch in pmp::read)
+        ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(
+            read_obj_nogil, "read_obj",
+            void (*)(pmp::SurfaceMesh &, const std::filesystem::path &));
+        ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(
+            read_off_nogil, "read_off",
+            void (*)(pmp::SurfaceMesh &, const std::filesystem::path &));
+        ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(
+            read_pmp_nogil, "read_pmp",
+            void (*)(pmp::SurfaceMesh &, const std::filesystem::path &));
+        ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(
+            read_stl_nogil, "read_stl",
+            void (*)(pmp::SurfaceMesh &, const std::filesystem::path &));
+        ROSETTA_REGISTER_FUNCTION(read_stl_mmap);
+
+        // Batch construction from flat coordinate / index buffers
+        ROSETTA_REGISTER_FUNCTION(add_vertices);
+        ROSETTA_REGISTER_FUNCTION(add_triangles);
+        ROSETTA_REGISTER_FUNCTION(build_triangle_mesh);
+
+        // Triangle reordering for rendering (vertex cache)
+        ROSETTA_REGISTER_FUNCTION(optimize_triangle_order);
 
         // Load mesh entirely in C++ and return it
         ROSETTA_REGISTER_FUNCTION(load_mesh);
@@ -226,11 +764,21 @@ namespace pmp_rosetta {
         // Copy mesh in C++
         ROSETTA_REGISTER_FUNCTION(copy_mesh);
 
+        // Binary STL writer with a large output buffer
+        ROSETTA_REGISTER_FUNCTION(write_stl_buffered);
+
+        // OBJ writer using std::to_chars and block writes
+        ROSETTA_REGISTER_FUNCTION(write_obj_fast);
+
+        // Compact 8/16-bit quantized triangle soup
+        ROSETTA_REGISTER_FUNCTION(write_quantized);
+
         // void write(const SurfaceMesh& mesh, const std::filesystem::path& file, const IOFlags&
         // flags)
-        ROSETTA_REGISTER_OVERLOADED_FUNCTION(pmp::write, void (*)(const pmp::SurfaceMesh &,
-                                                                  const std::filesystem::path &,
-                                                                  const pmp::IOFlags &));
+        ROSETTA_REGISTER_OVERLOADED_FUNCTION_AS(write_nogil, "write",
+                                                void (*)(const pmp::SurfaceMesh &,
+                                                         const std::filesystem::path &,
+                                                         const pmp::IOFlags &));
     }
 
 } // namespace pmp_rosetta
@@ -10,11 +10,21 @@ This script demonstrates:
 Usage:
     python test_remesh.py input.obj output.obj
     python test_remesh.py input.stl output.stl
+    python test_remesh.py meshes/ [output_dir]      # Batch: every mesh in a directory
+    python test_remesh.py "meshes/*.stl" [output_dir]  # Batch: glob pattern
+    python test_remesh.py --pipeline meshes/ [output_dir]  # Batch: load/remesh/save threads
+    python test_remesh.py --quantize=16 input.obj out.pmpq  # Quantized PMPQ output (8 or 16 bits)
     python test_remesh.py  # Uses a generated test mesh
 """
 
 import sys
 import os
+import glob
+import queue
+import threading
+from functools import partial
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     import pmp
@@ -24,13 +34,72 @@ except ImportError:
     sys.exit(1)
 
 
-def print_mesh_info(mesh, label="Mesh"):
-    """Print basic mesh statistics."""
-    print(f"{label}:")
-    print(f"  Vertices:  {mesh.n_vertices()}")
-    print(f"  Edges:     {mesh.n_edges()}")
-    print(f"  Faces:     {mesh.n_faces()}")
-    print(f"  Triangles: {mesh.is_triangle_mesh()}")
+MESH_INFO_TEMPLATE = (
+    "{label}:\n"
+    "  Vertices:  {nv}\n"
+    "  Edges:     {ne}\n"
+    "  Faces:     {nf}\n"
+    "  Triangles: {tri}"
+)
+
+
+# Format-specific readers, dispatched on the lowercase file extension.
+# Anything else goes through the generic pmp.read.
+LOADERS = {
+    '.obj': pmp.read_obj,
+    '.off': pmp.read_off,
+    '.pmp': pmp.read_pmp,
+    '.stl': pmp.read_stl_mmap,  # mmap fast path, ASCII falls back to read_stl
+}
+
+
+# Shared write flags for the generic pmp.write path (STL and OBJ have their
+# own writers), built once instead of on every save
+ASCII_FLAGS = pmp.IOFlags()
+ASCII_FLAGS.use_binary = False
+
+
+# Extension of the quantized triangle soup written by pmp.write_quantized
+QUANTIZED_EXT = '.pmpq'
+
+
+# Rough bytes per face in an OBJ file ("v x y z" lines included), used to
+# size the mesh before reading. Calibrated on data/bunny.obj (~40 B/face);
+# files with normals or texture coordinates only over-reserve.
+OBJ_BYTES_PER_FACE = 40
+
+
+def reserve_for_file(mesh, filepath, ext):
+    """
+    Reserve mesh storage ahead of reading to avoid grow-and-copy passes.
+
+    Only OBJ needs a hint here: the binary STL reader sizes the mesh from
+    the triangle count in its header, and pmp.read clears the mesh anyway.
+    The hint costs one stat() of the file before reading it.
+    """
+    if ext != '.obj':
+        return
+    n_faces = os.path.getsize(filepath) // OBJ_BYTES_PER_FACE
+    # Closed triangle mesh: V ~ F/2, E ~ 3F/2
+    mesh.reserve(n_faces // 2, 3 * n_faces // 2, n_faces)
+
+
+def triangle_flag(mesh, ext=None):
+    """is_triangle_mesh(), skipping the face walk for STL input."""
+    # Both STL readers (read_stl_mmap and its read_stl fallback) only ever
+    # call add_triangle
+    if ext == '.stl':
+        return True
+    return mesh.is_triangle_mesh()
+
+
+def print_mesh_info(mesh, label="Mesh", is_triangle=None):
+    """Print basic mesh statistics (is_triangle: known triangle flag, if any)."""
+    # Query the bindings once each
+    if is_triangle is None:
+        is_triangle = mesh.is_triangle_mesh()
+    nv, ne, nf, tri = mesh.n_vertices(), mesh.n_edges(), mesh.n_faces(), is_triangle
+    print(MESH_INFO_TEMPLATE.format(label=label, nv=nv, ne=ne, nf=nf, tri=tri))
     
     # Compute some metrics
     # bbox = pmp.bounds(mesh)
@@ -53,15 +122,28 @@ def create_test_mesh():
     return mesh
 
 
-def load_mesh(filepath):
+def file_ext(filepath):
+    """Lowercase extension of a path, including the dot."""
+    return Path(filepath).suffix.lower()
+
+
+def load_mesh(filepath, ext=None):
     """Load a mesh from file (OBJ, STL, OFF, etc.)."""
     print(f"Loading mesh from: {filepath}")
     
-    if not os.path.exists(filepath):
-        raise FileNotFoundError(f"File not found: {filepath}")
-    
     mesh = pmp.SurfaceMesh()
-    pmp.read(mesh, filepath)
+    if ext is None:
+        ext = file_ext(filepath)
+    
+    # No existence check up front: the reader opens the file anyway, so
+    # only look at why it failed (OBJ still stats the file for its size hint)
+    try:
+        reserve_for_file(mesh, filepath, ext)
+        LOADERS.get(ext, pmp.read)(mesh, filepath)
+    except (RuntimeError, OSError) as e:
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"File not found: {filepath}") from e
+        raise
     
     if mesh.is_empty():
         raise RuntimeError(f"Failed to load mesh or mesh is empty: {filepath}")
@@ -69,52 +151,279 @@ def load_mesh(filepath):
     return mesh
 
 
-def save_mesh(mesh, filepath):
-    """Save a mesh to file."""
-    print(f"Saving mesh to: {filepath}")
+def save_mesh(mesh, filepath, ext=None, quantize_bits=None):
+    """
+    Save a mesh to file.
     
-    flags = pmp.IOFlags()
-    flags.use_binary = filepath.lower().endswith('.stl')
+    Args:
+        mesh: The SurfaceMesh to write
+        filepath: Output path
+        ext: Lowercase extension of filepath. If None, computed from the path.
+        quantize_bits: If 8 or 16, write the compact quantized PMPQ format
+            (coordinates relative to the bounding box). The path must then
+            end in QUANTIZED_EXT, so PMPQ never hides under another format.
+    """
+    print(f"Saving mesh to: {filepath}")
     
-    pmp.write(mesh, filepath, flags)
+    if ext is None:
+        ext = file_ext(filepath)
+    if quantize_bits:
+        if ext != QUANTIZED_EXT:
+            raise ValueError(f"Quantized output needs a {QUANTIZED_EXT} file: {filepath}")
+        pmp.write_quantized(mesh, filepath, quantize_bits)
+    elif ext == '.stl':
+        # Binary STL through a large write buffer (fewer syscalls on big meshes)
+        pmp.write_stl_buffered(mesh, filepath)
+    elif ext == '.obj':
+        # Positions and faces only, fast float formatting
+        pmp.write_obj_fast(mesh, filepath)
+    else:
+        pmp.write(mesh, filepath, ASCII_FLAGS)
     print(f"  Saved successfully!")
 
 
-def remesh(mesh, target_edge_length=None):
+def remesh(mesh, target_edge_length=None, max_iter=10, tol=None, input_ext=None,
+           adaptive=False, min_iter=3, is_triangle=None):
     """
-    Apply uniform remeshing to the mesh.
+    Apply uniform (or curvature-adaptive) remeshing to the mesh.
     
     Args:
         mesh: The input SurfaceMesh (modified in place)
         target_edge_length: Target edge length. If None, computed automatically.
+            With adaptive=True, edges range from half to twice this length.
+        max_iter: Maximum number of remeshing iterations.
+        min_iter: With tol, iterations always run, in a single PMP call,
+            before the convergence checks start.
+        tol: If set, stop early once the relative change in edge count
+            between two iterations falls below this value. Off by default:
+            each PMP call takes the current mesh as its projection reference
+            (and, in adaptive mode, recomputes the curvature sizing from it),
+            so later iterations project onto the previous output instead of
+            the input surface and the approximation error builds up.
+        input_ext: Lowercase extension of the source file, if known. STL
+            files only hold triangles, so the triangle check is skipped.
+        adaptive: Use pmp.adaptive_remeshing, which derives a per-vertex
+            target length from the local curvature in C++.
+        is_triangle: Result of mesh.is_triangle_mesh() if the caller already
+            has it, to avoid another pass over the faces.
     """
     # Ensure the mesh is triangulated
-    if not mesh.is_triangle_mesh():
+    if is_triangle is None:
+        is_triangle = triangle_flag(mesh, input_ext)
+    if not is_triangle:
         print("Triangulating mesh...")
         pmp.triangulate(mesh)
     
     # Compute target edge length if not specified
     if target_edge_length is None:
-        bbox = pmp.bounds(mesh)
-        bbox_size = bbox.size()
-
-        # print(bbox, bbox_size)
+        # BoundingBox.size() is the diagonal length, computed in a single
+        # C++ pass over the positions (no copy to Python)
+        diagonal = pmp.bounds_fast(mesh).size()
 
-        # Use ~1% of the bounding box diagonal as target edge length
-        diagonal = bbox_size
+        # Use ~2% of the bounding box diagonal as target edge length
         target_edge_length = diagonal * 0.02
         print(f"  Auto-computed target edge length: {target_edge_length:.4f}")
     
-    print(f"Applying uniform remeshing (target edge length: {target_edge_length:.4f})...")
+    if adaptive:
+        # Same ratios as the "Auto" button of the viewer
+        min_edge = target_edge_length * 0.5
+        max_edge = target_edge_length * 2.0
+        approx_error = target_edge_length * 0.25
+        print(f"Applying adaptive remeshing (min={min_edge:.4f}, max={max_edge:.4f}, "
+              f"err={approx_error:.4f})...")
+        step = lambda n: pmp.adaptive_remeshing(mesh, min_edge, max_edge, approx_error, n, True)
+    else:
+        print(f"Applying uniform remeshing (target edge length: {target_edge_length:.4f})...")
+        step = lambda n: pmp.uniform_remeshing(mesh, target_edge_length, n, True)
     
-    # Uniform remeshing parameters:
-    # - target_edge_length: desired edge length
-    # - n_iterations: number of remeshing iterations (default ~10)
+    # Remeshing parameters:
+    # - edge length(s): desired edge length, or adaptive bounds
+    # - n_iterations: every PMP call copies the current mesh as the reference
+    #   surface for projection, so by default all iterations share one call;
+    #   with tol, the iterations that always run share one call and the rest
+    #   go one at a time so we can stop once converged
     # - use_projection: project vertices back to original surface
-    pmp.uniform_remeshing(mesh, target_edge_length, 10, True)
+    if tol is None:
+        step(max_iter)
+        n_first = max_iter
+    else:
+        n_first = max(1, min(min_iter, max_iter))
+        step(n_first)
+    for i in range(n_first, max_iter):
+        prev_edges = mesh.n_edges()
+        step(1)
+        if abs(mesh.n_edges() - prev_edges) < tol * prev_edges:
+            print(f"  Converged after {i + 1} iteration(s)")
+            break
+    
+    # Clean up (only if remeshing actually deleted elements)
+    if mesh.has_garbage():
+        mesh.garbage_collection()
+
+
+# Extensions picked up when a directory is given as input
+MESH_EXTENSIONS = ('.obj', '.stl', '.off', '.pmp')
+
+
+def _process_one(input_file, output_file, quantize_bits=None):
+    """
+    Load, remesh and save a single mesh.
+
+    Runs inside a worker process in batch mode: only the paths cross the
+    process boundary, the (non-picklable) SurfaceMesh stays in the worker.
+    """
+    in_ext = file_ext(input_file)
+    out_ext = file_ext(output_file)
+    mesh = load_mesh(input_file, in_ext)
+    is_tri = triangle_flag(mesh, in_ext)
+    
+    print()
+    print_mesh_info(mesh, "Input mesh", is_triangle=is_tri)
+    
+    # Apply remeshing
+    remesh(mesh, input_ext=in_ext, is_triangle=is_tri)
+    
+    print()
+    # Remeshing output is triangular by construction
+    print_mesh_info(mesh, "Remeshed mesh", is_triangle=True)
     
-    # Clean up
-    mesh.garbage_collection()
+    # Save result
+    save_mesh(mesh, output_file, out_ext, quantize_bits)
+    return output_file
+
+
+def _try_process_one(input_file, output_file, quantize_bits=None):
+    """
+    _process_one for the process pool: returns None on success, or the error
+    message, so one bad file does not abort the whole batch.
+    """
+    try:
+        _process_one(input_file, output_file, quantize_bits)
+    except Exception as e:
+        # Messages pickle reliably, the bindings' exceptions may not
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+def batch_outputs(input_files, output_dir, ext=None):
+    """
+    Output paths for a batch: "remeshed_" + name, under the input's path
+    relative to the common input directory, so that same-named files from
+    different directories (glob input) do not overwrite each other.
+    If ext is given, it replaces the input extension.
+    """
+    input_dirs = [os.path.dirname(os.path.abspath(f)) for f in input_files]
+    base = os.path.commonpath(input_dirs)
+    output_files = []
+    for f, d in zip(input_files, input_dirs):
+        out_dir = os.path.normpath(os.path.join(output_dir, os.path.relpath(d, base)))
+        os.makedirs(out_dir, exist_ok=True)
+        name = "remeshed_" + os.path.basename(f)
+        if ext is not None:
+            name = Path(name).stem + ext
+        output_files.append(os.path.join(out_dir, name))
+    return output_files
+
+
+def collect_inputs(pattern):
+    """Expand a directory or glob pattern into a sorted list of mesh files."""
+    if os.path.isdir(pattern):
+        return sorted(
+            os.path.join(pattern, name) for name in os.listdir(pattern)
+            if file_ext(name) in MESH_EXTENSIONS
+        )
+    return sorted(glob.glob(pattern))
+
+
+# End-of-stream marker for the pipeline queues
+_DONE = object()
+
+
+def run_pipeline(input_files, output_files, quantize_bits=None):
+    """
+    Remesh several files in one process with a 3-stage thread pipeline.
+    
+    Loading (I/O), remeshing (compute) and saving (I/O) run in their own
+    threads, so the next file loads and the previous one saves while the
+    current one is remeshed. Queues hold at most 2 meshes to bound memory.
+    A file that fails is reported and skipped, the others carry on.
+    """
+    loaded = queue.Queue(maxsize=2)
+    remeshed = queue.Queue(maxsize=2)
+    errors = []
+    
+    def loader():
+        for input_file, output_file in zip(input_files, output_files):
+            try:
+                in_ext = file_ext(input_file)
+                loaded.put((load_mesh(input_file, in_ext), in_ext, output_file))
+            except Exception as e:
+                errors.append((input_file, e))
+        loaded.put(_DONE)
+    
+    def remesher():
+        while (item := loaded.get()) is not _DONE:
+            mesh, in_ext, output_file = item
+            try:
+                remesh(mesh, input_ext=in_ext)
+                remeshed.put((mesh, output_file))
+            except Exception as e:
+                errors.append((output_file, e))
+        remeshed.put(_DONE)
+    
+    def saver():
+        while (item := remeshed.get()) is not _DONE:
+            mesh, output_file = item
+            try:
+                save_mesh(mesh, output_file, quantize_bits=quantize_bits)
+                print(f"  Done: {output_file}")
+            except Exception as e:
+                errors.append((output_file, e))
+    
+    threads = [threading.Thread(target=stage) for stage in (loader, remesher, saver)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    
+    for filepath, e in errors:
+        print(f"  Failed: {filepath}: {e}")
+
+
+def run_batch(input_files, output_dir, pipeline=False, quantize_bits=None):
+    """
+    Remesh several files in parallel.
+    
+    By default one worker process per core handles whole files; with
+    pipeline=True a single process overlaps load/remesh/save in threads.
+    Either way, a file that fails is reported and skipped.
+    """
+    output_files = batch_outputs(input_files, output_dir,
+                                 QUANTIZED_EXT if quantize_bits else None)
+    
+    if pipeline:
+        print(f"Remeshing {len(input_files)} files with a load/remesh/save pipeline...")
+        run_pipeline(input_files, output_files, quantize_bits)
+        return
+    
+    n_workers = min(os.cpu_count() or 1, len(input_files))
+    # A few chunks per worker keeps the load balanced without paying
+    # one IPC round-trip per file on large batches
+    chunksize = max(1, len(input_files) // (n_workers * 4))
+    
+    print(f"Remeshing {len(input_files)} files with {n_workers} workers...")
+    errors = []
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        results = executor.map(partial(_try_process_one, quantize_bits=quantize_bits),
+                               input_files, output_files, chunksize=chunksize)
+        for input_file, output_file, error in zip(input_files, output_files, results):
+            if error is None:
+                print(f"  Done: {output_file}")
+            else:
+                errors.append((input_file, error))
+    
+    for filepath, e in errors:
+        print(f"  Failed: {filepath}: {e}")
 
 
 def main():
@@ -123,16 +432,19 @@ def main():
     print("=" * 60)
     print()
     
-    # Parse command line arguments
-    if len(sys.argv) >= 3:
-        input_file = sys.argv[1]
-        output_file = sys.argv[2]
-        mesh = load_mesh(input_file)
-    elif len(sys.argv) == 2:
-        input_file = sys.argv[1]
-        output_file = "remeshed_" + os.path.basename(input_file)
-        mesh = load_mesh(input_file)
-    else:
+    args = sys.argv[1:]
+    pipeline = '--pipeline' in args
+    if pipeline:
+        args.remove('--pipeline')
+    quantize_bits = None
+    for arg in [a for a in args if a.startswith('--quantize=')]:
+        args.remove(arg)
+        bits = arg.split('=', 1)[1]
+        if bits not in ('8', '16'):
+            sys.exit("--quantize takes 8 or 16 bits")
+        quantize_bits = int(bits)
+    
+    if len(args) < 1:
         # # No arguments - create a test mesh
         # input_file = None
         # output_file = "remeshed_test.obj"
@@ -140,17 +452,24 @@ def main():
         print("no argument provided")
         exit()
     
-    print()
-    print_mesh_info(mesh, "Input mesh")
-    
-    # Apply remeshing
-    remesh(mesh)
-    
-    print()
-    print_mesh_info(mesh, "Remeshed mesh")
-    
-    # Save result
-    save_mesh(mesh, output_file)
+    # Parse command line arguments
+    input_arg = args[0]
+    if os.path.isdir(input_arg) or glob.has_magic(input_arg):
+        input_files = collect_inputs(input_arg)
+        if not input_files:
+            print(f"no mesh found for: {input_arg}")
+            exit()
+        output_dir = args[1] if len(args) >= 2 else "remeshed"
+        run_batch(input_files, output_dir, pipeline, quantize_bits)
+    else:
+        input_file = input_arg
+        if len(args) >= 2:
+            output_file = args[1]
+        else:
+            output_file = "remeshed_" + os.path.basename(input_file)
+        if quantize_bits:
+            output_file = str(Path(output_file).with_suffix(QUANTIZED_EXT))
+        _process_one(input_file, output_file, quantize_bits)
     
     print()
     print("=" * 60)
@@ -10,6 +10,8 @@ This version avoids PMP mesh creation issues by:
 
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import numpy as np
 
 try:
@@ -32,7 +34,7 @@ from PyQt5.QtWidgets import (
     QSplitter, QStatusBar, QFrame, QSlider, QMessageBox, QComboBox,
     QCheckBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QObject, QThread, pyqtSignal
 
 # Available color palettes for visualization
 COLOR_PALETTES = [
@@ -41,6 +43,9 @@ COLOR_PALETTES = [
     'turbo', 'gnuplot', 'gnuplot2', 'ocean', 'terrain'
 ]
 
+# Prefix of the point-data arrays the viewer attaches for display
+DISPLAY_PREFIX = '_disp_'
+
 # Available attributes for visualization
 ATTRIBUTES = [
     'Solid Color',
@@ -54,58 +59,178 @@ ATTRIBUTES = [
 ]
 
 
-def pyvista_to_pmp(pv_mesh):
-    """Convert a PyVista PolyData to a PMP SurfaceMesh."""
-    # Get vertices and faces from PyVista
-    vertices = pv_mesh.points
-    faces = pv_mesh.faces
-
-    # Create PMP mesh and add vertices
-    mesh = pmp.SurfaceMesh()
-
-    # Add all vertices
-    pmp_vertices = []
-    for v in vertices:
-        pmp_v = mesh.add_vertex(pmp.Point(float(v[0]), float(v[1]), float(v[2])))
-        pmp_vertices.append(pmp_v)
-
-    # Parse PyVista faces format: [n, v0, v1, ..., vn, n, v0, v1, ..., vn, ...]
-    i = 0
-    while i < len(faces):
-        n = faces[i]  # Number of vertices in this face
-        if n == 3:
-            mesh.add_triangle(
-                pmp_vertices[faces[i + 1]],
-                pmp_vertices[faces[i + 2]],
-                pmp_vertices[faces[i + 3]]
-            )
-        elif n == 4:
-            mesh.add_quad(
-                pmp_vertices[faces[i + 1]],
-                pmp_vertices[faces[i + 2]],
-                pmp_vertices[faces[i + 3]],
-                pmp_vertices[faces[i + 4]]
-            )
-        i += n + 1
-
-    return mesh
+def triangle_arrays(pv_mesh):
+    """
+    Copies of the (N, 3) float32 points and (M, 3) int32 triangles of an
+    all-triangle PolyData. The copies share nothing with the VTK object, so
+    another thread can use them while the PolyData keeps changing.
+    """
+    # Faces are [3, v0, v1, v2, 3, ...], drop the count column
+    points = np.array(pv_mesh.points, dtype=np.float32)
+    tris = pv_mesh.faces.reshape(-1, 4)[:, 1:].astype(np.int32)
+    return points, tris
+
+
+def triangle_arrays_to_pmp(points, tris):
+    """Build a PMP SurfaceMesh from triangle_arrays() output."""
+    # The mesh is built in one C++ call, with no Python callback per element
+    return pmp.build_triangle_mesh(points.ravel().tolist(), tris.ravel().tolist())
+
+
+def triangle_faces(tris):
+    """PyVista face array [3, v0, v1, v2, 3, ...] for an (M, 3) index array."""
+    # Fill one preallocated (M, 4) block instead of stacking temporaries. It is
+    # built in VTK's id type, which the CellArray would convert to anyway
+    faces = np.empty((len(tris), 4), dtype=pv.ID_TYPE)
+    faces[:, 0] = 3
+    faces[:, 1:] = tris
+    return faces.reshape(-1)
+
+
+def render_order(n_vertices, tris, cache_size=16):
+    """Cache-friendly order of an (M, 3) triangle index array.
+
+    Triangles are reordered for the GPU vertex cache, then vertices are
+    renumbered by first use so that fetches walk the buffer forward.
+    Returns (vertex_order, triangle_order, reindexed triangles).
+    """
+    triangle_order = np.asarray(
+        pmp.optimize_triangle_order(tris.ravel().tolist(), n_vertices, cache_size),
+        dtype=np.int64
+    )
+    tris = tris[triangle_order]
+
+    # Vertices in order of first use, unreferenced ones last
+    used, first_use = np.unique(tris.ravel(), return_index=True)
+    vertex_order = np.concatenate([
+        used[np.argsort(first_use)],
+        np.setdiff1d(np.arange(n_vertices), used, assume_unique=True)
+    ])
+    # Indices in VTK's id type, so triangle_faces does not convert them again
+    remap = np.empty(n_vertices, dtype=pv.ID_TYPE)
+    remap[vertex_order] = np.arange(n_vertices, dtype=pv.ID_TYPE)
+    return vertex_order, triangle_order, remap[tris]
+
+
+def copy_permuted(source, target, order):
+    """Copy point or cell data arrays permuted by order, active attributes included."""
+    for name in source.keys():
+        target[name] = source[name][order]
+    # Normals, texture coordinates, active scalars, ... are flags of the VTK
+    # attribute set, not of the arrays: carry them over by name
+    source, target = source.VTKObject, target.VTKObject
+    for attribute in range(source.NUM_ATTRIBUTES):
+        array = source.GetAbstractAttribute(attribute)
+        if array is not None and array.GetName():
+            target.SetActiveAttribute(array.GetName(), attribute)
+
+
+def optimize_polydata(pv_mesh):
+    """Copy of an all-triangle PolyData in render order, data arrays included."""
+    # Cell data only maps one-to-one onto the faces when there are no other cells
+    if not pv_mesh.is_all_triangles or pv_mesh.n_verts or pv_mesh.n_lines or pv_mesh.n_strips:
+        return pv_mesh
+    tris = pv_mesh.faces.reshape(-1, 4)[:, 1:]
+    vertex_order, triangle_order, tris = render_order(pv_mesh.n_points, tris)
+
+    optimized = pv.PolyData(pv_mesh.points[vertex_order], triangle_faces(tris))
+    copy_permuted(pv_mesh.point_data, optimized.point_data, vertex_order)
+    copy_permuted(pv_mesh.cell_data, optimized.cell_data, triangle_order)
+    return optimized
 
 
 def pmp_to_pyvista(mesh):
     """Convert a PMP SurfaceMesh to a PyVista PolyData."""
     # Get vertices
+    # PMP stores float coordinates: keep float32, VTK uses it natively
     verts = mesh.vertices()
-    vertices = np.array(verts, dtype=np.float64).reshape(-1, 3)
+    vertices = np.asarray(verts, dtype=np.float32).reshape(-1, 3)
 
     # Get faces
     indices = mesh.indices()
-    indices_array = np.array(indices, dtype=np.int64).reshape(-1, 3)
+    indices_array = np.asarray(indices, dtype=np.int32).reshape(-1, 3)
+
+    # Remeshing leaves faces in creation order: reorder them for rendering
+    vertex_order, _, indices_array = render_order(len(vertices), indices_array)
+
+    return pv.PolyData(vertices[vertex_order], triangle_faces(indices_array))
+
+
+@contextmanager
+def deferred_render(plotter):
+    """Suppress renders of a plotter inside the block, then render once."""
+    render = plotter.render
+    plotter.render = lambda *args, **kwargs: None
+    try:
+        yield
+    finally:
+        plotter.render = render
+        render()
+
+
+def camera_state(plotter):
+    """(position, focal_point, up) of the plotter camera, or None without one."""
+    camera = getattr(plotter, 'camera', None)
+    if camera is None:
+        return None
+    return camera.position, camera.focal_point, camera.up
+
+
+def set_camera_state(plotter, state):
+    """Apply a camera_state() tuple; return False if nothing changed."""
+    camera = getattr(plotter, 'camera', None)
+    if state is None or camera is None or camera_state(plotter) == state:
+        return False
+    camera.position, camera.focal_point, camera.up = state
+    return True
+
+
+class RemeshWorker(QObject):
+    """Converts to PMP, remeshes and converts back, off the GUI thread."""
+
+    finished = pyqtSignal(object)  # remeshed pv.PolyData
+    failed = pyqtSignal(str)
+
+    def __init__(self, points, tris, is_adaptive, params):
+        super().__init__()
+        # Arrays from triangle_arrays(): VTK objects are not thread-safe
+        self.points = points
+        self.tris = tris
+        self.is_adaptive = is_adaptive
+        # (min_edge, max_edge, approx_error) if adaptive, else (edge_length,)
+        self.params = params
+
+    def run(self):
+        """Remesh and emit finished(mesh) or failed(message)."""
+        try:
+            pmp_mesh = triangle_arrays_to_pmp(self.points, self.tris)
+
+            # Apply remeshing based on selected method
+            if self.is_adaptive:
+                min_edge, max_edge, approx_error = self.params
+                pmp.adaptive_remeshing(
+                    pmp_mesh,
+                    min_edge,      # min_edge_length
+                    max_edge,      # max_edge_length
+                    approx_error,  # approx_error
+                    10,   # iterations
+                    True  # use projection
+                )
+            else:
+                edge_length, = self.params
+                pmp.uniform_remeshing(
+                    pmp_mesh,
+                    edge_length,
+                    10,   # iterations
+                    True  # use projection
+                )
+            pmp_mesh.garbage_collection()
 
-    # PyVista face format: [n, v0, v1, v2, n, v0, v1, v2, ...]
-    n_faces = len(indices_array)
-    faces = np.column_stack([np.full(n_faces, 3), indices_array]).ravel()
+            # Convert back to PyVista
+            self.finished.emit(pmp_to_pyvista(pmp_mesh))
 
-    return pv.PolyData(vertices, faces)
+        except Exception as e:
+            self.failed.emit(str(e))
 
 
 class RemeshViewer(QMainWindow):
@@ -120,6 +245,15 @@ class RemeshViewer(QMainWindow):
         self.target_edge_length = 0.02
         self.auto_edge_length = 0.02
         self._syncing_cameras = False  # Flag to prevent recursive sync
+        self._actors = {}  # plotter -> mesh actor currently displayed
+        self._actor_attribute = {}  # plotter -> attribute shown by that actor
+        self._bounds = None  # (xmin, xmax, ymin, ymax, zmin, zmax) of original_mesh
+        self._bbox_diag = None  # its diagonal length
+        self._remesh_thread = None  # QThread running the current RemeshWorker
+        self._remesh_worker = None
+        self._remesh_method = None
+        self._scalar_pool = ThreadPoolExecutor(max_workers=2)  # one per view
+        self._luts = {}  # palette -> lookup table built from the colormap
 
         self.setup_ui()
         self.setup_status_bar()
@@ -333,7 +467,7 @@ class RemeshViewer(QMainWindow):
 
         self.show_colorbar_checkbox = QCheckBox("Colorbar")
         self.show_colorbar_checkbox.setChecked(True)
-        self.show_colorbar_checkbox.stateChanged.connect(self.on_attribute_changed)
+        self.show_colorbar_checkbox.stateChanged.connect(self.on_colorbar_changed)
         row3.addWidget(self.show_colorbar_checkbox)
 
         row3.addStretch()
@@ -356,20 +490,89 @@ class RemeshViewer(QMainWindow):
             self.max_edge_spinbox.setValue(self.auto_edge_length * 2.0)
             self.approx_error_spinbox.setValue(self.auto_edge_length * 0.25)
 
+    def views(self):
+        """(plotter, mesh, default color) of both views."""
+        return [
+            (self.plotter_original, self.original_mesh, 'lightblue'),
+            (self.plotter_remeshed, self.remeshed_mesh, 'lightgreen'),
+        ]
+
+    def scalar_actors(self):
+        """(plotter, actor) of the views currently colored by scalars."""
+        for plotter, _, _ in self.views():
+            actor = self._actors.get(plotter)
+            if actor is not None and actor.mapper.scalar_visibility:
+                yield plotter, actor
+
     def on_attribute_changed(self, _=None):
-        """Handle attribute selection change - update both views."""
-        self.update_mesh_display(self.plotter_original, self.original_mesh, 'lightblue')
-        self.update_mesh_display(self.plotter_remeshed, self.remeshed_mesh, 'lightgreen')
+        """Handle attribute selection change - rebuild views showing another attribute."""
+        attribute = self.attribute_combo.currentText()
+        stale = [view for view in self.views() if self._actor_attribute.get(view[0]) != attribute]
+
+        # The meshes are independent: compute their missing arrays concurrently,
+        # display_scalars then finds them on the meshes
+        key = DISPLAY_PREFIX + attribute
+        pending = [
+            (mesh, self._scalar_pool.submit(self.compute_scalars, mesh, attribute))
+            for _, mesh, _ in stale
+            if mesh is not None and attribute != 'Solid Color' and key not in mesh.point_data
+        ]
+        for mesh, future in pending:
+            scalars = future.result()
+            if scalars is not None:
+                mesh.point_data[key] = scalars
+
+        for plotter, mesh, color in stale:
+            self.update_mesh_display(plotter, mesh, color)
 
     def on_palette_changed(self, _=None):
-        """Handle palette selection change - update both views."""
-        self.update_mesh_display(self.plotter_original, self.original_mesh, 'lightblue')
-        self.update_mesh_display(self.plotter_remeshed, self.remeshed_mesh, 'lightgreen')
+        """Handle palette selection change - swap the colormap of the actors in place."""
+        palette = self.palette_combo.currentText()
+        for plotter, actor in self.scalar_actors():
+            # Copy into the actor's table so that its scalar bar follows
+            lut = actor.mapper.lookup_table
+            clim = lut.scalar_range
+            lut.DeepCopy(self.palette_lut(palette))
+            lut.scalar_range = clim
+            plotter.render()
 
     def on_show_edges_changed(self, _=None):
-        """Handle show edges checkbox change - update both views."""
-        self.update_mesh_display(self.plotter_original, self.original_mesh, 'lightblue')
-        self.update_mesh_display(self.plotter_remeshed, self.remeshed_mesh, 'lightgreen')
+        """Handle show edges checkbox change - toggle edges of the actors in place."""
+        show_edges = self.show_edges_checkbox.isChecked()
+        for plotter, _, _ in self.views():
+            actor = self._actors.get(plotter)
+            if actor is not None:
+                actor.prop.show_edges = show_edges
+                plotter.render()
+
+    def on_colorbar_changed(self, _=None):
+        """Handle colorbar checkbox change - add or remove the scalar bars only."""
+        show_colorbar = self.show_colorbar_checkbox.isChecked()
+        attribute = self.attribute_combo.currentText()
+        for plotter, actor in self.scalar_actors():
+            if show_colorbar:
+                plotter.add_scalar_bar(title=attribute, mapper=actor.mapper)
+            elif plotter.scalar_bars:
+                plotter.remove_scalar_bar()
+            plotter.render()
+
+    def palette_lut(self, palette):
+        """
+        Lookup table of a palette, built from the colormap once. The range is
+        per view, so callers get a cheap copy of the cached table.
+        """
+        lut = self._luts.get(palette)
+        if lut is None:
+            lut = self._luts[palette] = pv.LookupTable(cmap=palette)
+        copy = pv.LookupTable()
+        copy.DeepCopy(lut)
+        return copy
+
+    def clear_view(self, plotter):
+        """Remove everything from a view and forget its actor."""
+        plotter.clear()
+        self._actors.pop(plotter, None)
+        self._actor_attribute.pop(plotter, None)
 
     def compute_scalars(self, mesh, attribute):
         """Compute scalar values for the given attribute."""
@@ -394,21 +597,50 @@ class RemeshViewer(QMainWindow):
             return mesh.curvature(curv_type='maximum')
         return None
 
+    def display_scalars(self, mesh, attribute):
+        """
+        Name of the point-data array holding the attribute on the mesh, or None
+        for a solid color. The array is computed on first use and kept on the
+        mesh, so later displays (and VTK) reuse the same array.
+        """
+        if mesh is None or attribute == 'Solid Color':
+            return None
+
+        key = DISPLAY_PREFIX + attribute
+        if key not in mesh.point_data:
+            scalars = self.compute_scalars(mesh, attribute)
+            if scalars is None:
+                return None
+            mesh.point_data[key] = scalars
+        return key
+
+    def scalar_range(self, mesh, attribute):
+        """
+        (min, max) of a display array, computed once and kept on the mesh as
+        field data under the array's name. NaN values are ignored.
+        """
+        key = DISPLAY_PREFIX + attribute
+        if key not in mesh.field_data:
+            axis = {'X Coordinate': 0, 'Y Coordinate': 1, 'Z Coordinate': 2}.get(attribute)
+            if axis is not None:
+                # Coordinate ranges are the bounds: no reduction needed
+                bounds = self._bounds if mesh is self.original_mesh else mesh.bounds
+                mesh.field_data[key] = np.asarray(bounds[2 * axis:2 * axis + 2], dtype=np.float64)
+            else:
+                values = mesh.point_data[key]
+                mesh.field_data[key] = np.array([np.nanmin(values), np.nanmax(values)])
+        lo, hi = mesh.field_data[key]
+        return float(lo), float(hi)
+
     def update_mesh_display(self, plotter, mesh, default_color):
         """Update mesh display with current visualization settings."""
         if mesh is None:
             return
 
         # Save camera state
-        try:
-            cam_pos = plotter.camera.position
-            cam_focal = plotter.camera.focal_point
-            cam_up = plotter.camera.up
-            has_camera = True
-        except:
-            has_camera = False
+        camera = camera_state(plotter)
 
-        plotter.clear()
+        self.clear_view(plotter)
         plotter.add_axes()
 
         attribute = self.attribute_combo.currentText()
@@ -416,14 +648,19 @@ class RemeshViewer(QMainWindow):
         show_edges = self.show_edges_checkbox.isChecked()
         show_colorbar = self.show_colorbar_checkbox.isChecked()
 
-        scalars = self.compute_scalars(mesh, attribute)
+        scalars = self.display_scalars(mesh, attribute)
 
         if scalars is not None:
-            # Display with scalars
-            plotter.add_mesh(
+            # Display with scalars (by array name, attached to the mesh); an
+            # explicit range spares VTK a min/max scan of the array
+            clim = self.scalar_range(mesh, attribute)
+            lut = self.palette_lut(palette)
+            lut.scalar_range = clim
+            actor = plotter.add_mesh(
                 mesh,
                 scalars=scalars,
-                cmap=palette,
+                cmap=lut,
+                clim=clim,
                 show_edges=show_edges,
                 edge_color='black',
                 opacity=1.0,
@@ -432,7 +669,7 @@ class RemeshViewer(QMainWindow):
             )
         else:
             # Display with solid color
-            plotter.add_mesh(
+            actor = plotter.add_mesh(
                 mesh,
                 show_edges=show_edges,
                 edge_color='black',
@@ -440,11 +677,12 @@ class RemeshViewer(QMainWindow):
                 opacity=1.0
             )
 
+        # Keep the actor so visualization toggles can update it in place
+        self._actors[plotter] = actor
+        self._actor_attribute[plotter] = attribute
+
         # Restore camera state
-        if has_camera:
-            plotter.camera.position = cam_pos
-            plotter.camera.focal_point = cam_focal
-            plotter.camera.up = cam_up
+        set_camera_state(plotter, camera)
 
         plotter.render()
 
@@ -461,42 +699,77 @@ class RemeshViewer(QMainWindow):
             plotter.add_axes()
             plotter.enable_anti_aliasing()
 
+        # Anti-aliasing multiplies the per-frame cost: drop it while either view
+        # is dragged (both re-render through the camera sync), restore on release
+        plotters = (self.plotter_original, self.plotter_remeshed)
+
+        def anti_aliasing_off(*args):
+            for plotter in plotters:
+                plotter.disable_anti_aliasing()
+
+        def anti_aliasing_on(other):
+            def restore(*args):
+                for plotter in plotters:
+                    plotter.enable_anti_aliasing()
+                # VTK renders the dragged view itself right after this event;
+                # the other one renders once, through the pending camera sync
+                self._sync_timer.stop()
+                if not self.do_pending_sync():
+                    other.render()
+            return restore
+
+        for plotter, other in zip(plotters, plotters[::-1]):
+            plotter.iren.add_observer('StartInteractionEvent', anti_aliasing_off)
+            plotter.iren.add_observer('EndInteractionEvent', anti_aliasing_on(other))
+
     def setup_camera_sync(self):
-        """Setup bidirectional camera synchronization between the two views."""
+        """
+        Setup bidirectional camera synchronization between the two views.
+
+        Interaction events only record which view moved; a 16 ms single-shot
+        timer then copies the camera once, so a drag re-renders the other view
+        at most ~60 times per second instead of on every mouse move.
+        """
+        self._pending_sync = None  # (source plotter, target plotter)
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(16)
+        self._sync_timer.timeout.connect(self.do_pending_sync)
+
         def sync_to_remeshed(*args):
-            if self._syncing_cameras:
-                return
-            self._syncing_cameras = True
-            try:
-                cam = self.plotter_original.camera
-                self.plotter_remeshed.camera.position = cam.position
-                self.plotter_remeshed.camera.focal_point = cam.focal_point
-                self.plotter_remeshed.camera.up = cam.up
-                self.plotter_remeshed.render()
-            except:
-                pass
-            finally:
-                self._syncing_cameras = False
+            self.request_sync(self.plotter_original, self.plotter_remeshed)
 
         def sync_to_original(*args):
-            if self._syncing_cameras:
-                return
-            self._syncing_cameras = True
-            try:
-                cam = self.plotter_remeshed.camera
-                self.plotter_original.camera.position = cam.position
-                self.plotter_original.camera.focal_point = cam.focal_point
-                self.plotter_original.camera.up = cam.up
-                self.plotter_original.render()
-            except:
-                pass
-            finally:
-                self._syncing_cameras = False
+            self.request_sync(self.plotter_remeshed, self.plotter_original)
 
         # Add observers to sync cameras on interaction
         self.plotter_original.iren.add_observer('InteractionEvent', sync_to_remeshed)
         self.plotter_remeshed.iren.add_observer('InteractionEvent', sync_to_original)
 
+    def request_sync(self, source, target):
+        """Schedule a camera copy from source to target (coalesced by the timer)."""
+        if self._syncing_cameras:
+            return
+        self._pending_sync = (source, target)
+        if not self._sync_timer.isActive():
+            self._sync_timer.start()
+
+    def do_pending_sync(self):
+        """Perform the last scheduled camera copy; return True if it rendered."""
+        if self._pending_sync is None:
+            return False
+        source, target = self._pending_sync
+        self._pending_sync = None
+        self._syncing_cameras = True
+        try:
+            # Nothing to do (and no render) if the cameras already match
+            if set_camera_state(target, camera_state(source)):
+                target.render()
+                return True
+            return False
+        finally:
+            self._syncing_cameras = False
+
     def on_slider_changed(self, value):
         """Handle slider value change."""
         ratio = value / 100.0
@@ -521,16 +794,11 @@ class RemeshViewer(QMainWindow):
 
     def compute_auto_edge_length(self):
         """Compute automatic edge length based on mesh bounding box."""
-        if self.original_mesh is None:
+        if self.original_mesh is None or self._bbox_diag is None:
             return
 
-        bounds = self.original_mesh.bounds
-        diagonal = np.sqrt(
-            (bounds[1] - bounds[0])**2 +
-            (bounds[3] - bounds[2])**2 +
-            (bounds[5] - bounds[4])**2
-        )
-        self.auto_edge_length = diagonal * 0.02
+        # Bounding box diagonal, cached when the mesh was loaded
+        self.auto_edge_length = self._bbox_diag * 0.02
         self.target_edge_length = self.auto_edge_length
 
         # Update uniform controls
@@ -571,6 +839,13 @@ class RemeshViewer(QMainWindow):
             if not self.original_mesh.is_all_triangles:
                 self.original_mesh = self.original_mesh.triangulate()
 
+            # Done once here: every later display reuses the reordered mesh
+            self.original_mesh = optimize_polydata(self.original_mesh)
+
+            # Bounds are fixed for this mesh: compute them once
+            self._bounds = np.asarray(self.original_mesh.bounds, dtype=np.float64)
+            self._bbox_diag = float(np.linalg.norm(self._bounds[1::2] - self._bounds[0::2]))
+
             # Compute auto edge length
             self.compute_auto_edge_length()
 
@@ -579,7 +854,7 @@ class RemeshViewer(QMainWindow):
             self.plotter_original.reset_camera()
 
             # Clear remeshed view
-            self.plotter_remeshed.clear()
+            self.clear_view(self.plotter_remeshed)
             self.remeshed_mesh = None
 
             # Update UI
@@ -601,67 +876,74 @@ class RemeshViewer(QMainWindow):
             self.status_bar.showMessage("Error loading mesh")
 
     def do_remesh(self):
-        """Perform remeshing using PMP."""
+        """Start remeshing using PMP on a worker thread."""
         if self.original_mesh is None:
             return
 
         is_adaptive = self.method_combo.currentIndex() == 1
 
-        try:
-            if is_adaptive:
-                min_edge = self.min_edge_spinbox.value()
-                max_edge = self.max_edge_spinbox.value()
-                approx_error = self.approx_error_spinbox.value()
-                self.status_bar.showMessage(
-                    f"Adaptive remeshing (min={min_edge:.4f}, max={max_edge:.4f}, err={approx_error:.4f})..."
-                )
-            else:
-                self.status_bar.showMessage(
-                    f"Uniform remeshing with edge length: {self.target_edge_length:.4f}..."
-                )
-            QApplication.processEvents()
-
-            # Convert PyVista mesh to PMP
-            pmp_mesh = pyvista_to_pmp(self.original_mesh)
-
-            # Triangulate if needed
-            if not pmp_mesh.is_triangle_mesh():
-                pmp.triangulate(pmp_mesh)
+        if is_adaptive:
+            min_edge = self.min_edge_spinbox.value()
+            max_edge = self.max_edge_spinbox.value()
+            approx_error = self.approx_error_spinbox.value()
+            params = (min_edge, max_edge, approx_error)
+            self.status_bar.showMessage(
+                f"Adaptive remeshing (min={min_edge:.4f}, max={max_edge:.4f}, err={approx_error:.4f})..."
+            )
+        else:
+            params = (self.target_edge_length,)
+            self.status_bar.showMessage(
+                f"Uniform remeshing with edge length: {self.target_edge_length:.4f}..."
+            )
 
-            # Apply remeshing based on selected method
-            if is_adaptive:
-                pmp.adaptive_remeshing(
-                    pmp_mesh,
-                    self.min_edge_spinbox.value(),   # min_edge_length
-                    self.max_edge_spinbox.value(),   # max_edge_length
-                    self.approx_error_spinbox.value(),  # approx_error
-                    10,   # iterations
-                    True  # use projection
-                )
-            else:
-                pmp.uniform_remeshing(
-                    pmp_mesh,
-                    self.target_edge_length,
-                    10,   # iterations
-                    True  # use projection
-                )
-            pmp_mesh.garbage_collection()
+        # load_mesh already triangulated the mesh. Take the arrays here, on
+        # the GUI thread: attribute changes keep adding arrays to the PolyData
+        # while the worker runs
+        assert self.original_mesh.is_all_triangles
+        points, tris = triangle_arrays(self.original_mesh)
 
-            # Convert back to PyVista
-            self.remeshed_mesh = pmp_to_pyvista(pmp_mesh)
+        # Keep the UI responsive but prevent overlapping runs / reloads
+        self.remesh_btn.setEnabled(False)
+        self.load_btn.setEnabled(False)
+        self._remesh_method = "Adaptive" if is_adaptive else "Uniform"
+
+        self._remesh_thread = QThread(self)
+        self._remesh_worker = RemeshWorker(points, tris, is_adaptive, params)
+        self._remesh_worker.moveToThread(self._remesh_thread)
+        self._remesh_thread.started.connect(self._remesh_worker.run)
+        self._remesh_worker.finished.connect(self.on_remesh_finished)
+        self._remesh_worker.failed.connect(self.on_remesh_failed)
+        self._remesh_thread.start()
+
+    def end_remesh_thread(self):
+        """Stop and release the worker thread once its run has ended."""
+        self._remesh_thread.quit()
+        self._remesh_thread.wait()
+        self._remesh_worker.deleteLater()
+        self._remesh_thread.deleteLater()
+        self._remesh_worker = None
+        self._remesh_thread = None
+        self.remesh_btn.setEnabled(True)
+        self.load_btn.setEnabled(True)
+
+    def on_remesh_finished(self, remeshed_mesh):
+        """Display the remeshed mesh (runs on the GUI thread)."""
+        self.end_remesh_thread()
 
-            # Display using current visualization settings
-            self.update_mesh_display(self.plotter_remeshed, self.remeshed_mesh, 'lightgreen')
-            self.plotter_remeshed.reset_camera()
+        try:
+            self.remeshed_mesh = remeshed_mesh
 
-            # Sync camera
-            self.sync_cameras()
+            # Display, reset and sync the camera under a single render
+            with deferred_render(self.plotter_remeshed):
+                self.update_mesh_display(self.plotter_remeshed, self.remeshed_mesh, 'lightgreen')
+                self.plotter_remeshed.reset_camera()
+                self.sync_cameras()
 
             # Update UI
             self.save_btn.setEnabled(True)
 
             # Update info
-            method_name = "Adaptive" if is_adaptive else "Uniform"
+            method_name = self._remesh_method
             self.remeshed_info.setText(
                 f"Remeshed ({method_name}): V={self.remeshed_mesh.n_points}, "
                 f"F={self.remeshed_mesh.n_faces_strict}"
@@ -674,19 +956,19 @@ class RemeshViewer(QMainWindow):
             )
 
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to remesh:\n{str(e)}")
-            self.status_bar.showMessage("Error during remeshing")
+            self.on_remesh_failed(str(e))
+
+    def on_remesh_failed(self, message):
+        """Report a remeshing error (runs on the GUI thread)."""
+        if self._remesh_thread is not None:
+            self.end_remesh_thread()
+        QMessageBox.critical(self, "Error", f"Failed to remesh:\n{message}")
+        self.status_bar.showMessage("Error during remeshing")
 
     def sync_cameras(self):
         """Sync the camera of the remeshed view with the original view."""
-        try:
-            cam = self.plotter_original.camera
-            self.plotter_remeshed.camera.position = cam.position
-            self.plotter_remeshed.camera.focal_point = cam.focal_point
-            self.plotter_remeshed.camera.up = cam.up
+        if set_camera_state(self.plotter_remeshed, camera_state(self.plotter_original)):
             self.plotter_remeshed.render()
-        except:
-            pass
 
     def save_mesh(self):
         """Save the remeshed mesh using PyVista."""
@@ -704,7 +986,13 @@ class RemeshViewer(QMainWindow):
             return
 
         try:
-            self.remeshed_mesh.save(filepath)
+            # Write without the display arrays attached by the viewer
+            mesh = self.remeshed_mesh.copy(deep=False)
+            for data in (mesh.point_data, mesh.field_data):
+                for name in list(data.keys()):
+                    if name.startswith(DISPLAY_PREFIX):
+                        del data[name]
+            mesh.save(filepath)
             self.status_bar.showMessage(f"Saved: {filepath}")
 
         except Exception as e:
@@ -713,6 +1001,11 @@ class RemeshViewer(QMainWindow):
 
     def closeEvent(self, event):
         """Clean up on close."""
+        # A running remesh cannot be interrupted, let it finish first
+        if self._remesh_thread is not None:
+            self._remesh_thread.quit()
+            self._remesh_thread.wait()
+        self._scalar_pool.shutdown()
         self.plotter_original.close()
         self.plotter_remeshed.close()
         event.accept()